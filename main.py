@@ -1,12 +1,18 @@
 """Airtable MCP Server with FastMCP and Structured Output"""
 
-import json
+import asyncio
 import os
-from typing import Dict, List, Optional, Any, Union
-from datetime import datetime
+import re
+import socket
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple, Union
+from datetime import datetime, timezone
 
-import requests
-from pydantic import BaseModel, Field
+import httpx
+import orjson
+from pydantic import BaseModel, ConfigDict
 from dotenv import load_dotenv
 
 from mcp.server.fastmcp import FastMCP
@@ -19,115 +25,393 @@ mcp = FastMCP("Airtable API Server")
 
 # Configuration
 AIRTABLE_API_BASE = "https://api.airtable.com/v0"
+AIRTABLE_BATCH_SIZE = 10  # Max records per create/update/delete request
+AUTO_PAGINATE_MAX_PAGES = 10  # Default page cap for list_records auto-pagination
+
+# Retry policy for transient Nango/Airtable failures
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# A 5xx on POST/PATCH may still have been applied, so only these methods retry it
+RETRY_5XX_METHODS = ("GET", "DELETE")
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5
+
+# Airtable allows 5 requests per second per base
+AIRTABLE_RATE_LIMIT = 5
+AIRTABLE_BASE_ID_PATTERN = re.compile(r"/(app[A-Za-z0-9]+)(?:/|$)")
+
+# Shared async HTTP/2 client so concurrent calls multiplex over pooled connections
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+SESSION: Optional[httpx.AsyncClient] = None
+
+# Process-wide cache for the Nango-issued Airtable token
+TOKEN_DEFAULT_TTL = 300.0
+TOKEN_REFRESH_MARGIN = 30.0
+_TOKEN_CACHE: Dict[str, Any] = {"token": None, "expires_at": 0.0, "headers": {}, "force_refresh": False}
+_lock = asyncio.Lock()
+
+# Bound on concurrent in-flight Airtable requests from fanned-out batches
+_HOST_SEM = asyncio.Semaphore(8)
+
+# Cached metadata responses: request URL -> (expires_at, etag, response)
+SCHEMA_CACHE_TTL = 300.0
+_SCHEMA_CACHE: Dict[str, Tuple[float, Optional[str], httpx.Response]] = {}
+
+class RateLimiter:
+    """Async token bucket that adapts its rate to 429 responses"""
+    
+    def __init__(self, rate: float, period: float = 1.0):
+        self.max_rate = rate
+        self.rate = rate
+        self.period = period
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a request may be sent"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.rate, self._tokens + (now - self._updated) * self.rate / self.period)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+    
+    def throttle(self) -> None:
+        """Halve the allowed rate after a rate-limited response"""
+        self.rate = max(1.0, self.rate / 2)
+        self._tokens = min(self._tokens, self.rate)
+    
+    def recover(self) -> None:
+        """Grow the allowed rate back towards its maximum after a success"""
+        self.rate = min(self.max_rate, self.rate + 0.5)
+
+_LIMITERS: Dict[str, RateLimiter] = {}
+
+def get_rate_limiter(url: str) -> Optional[RateLimiter]:
+    """Get the rate limiter for the base an Airtable URL targets, if any"""
+    if not url.startswith(AIRTABLE_API_BASE):
+        return None
+    match = AIRTABLE_BASE_ID_PATTERN.search(url, len(AIRTABLE_API_BASE))
+    if not match:
+        return None
+    base_id = match.group(1)
+    limiter = _LIMITERS.get(base_id)
+    if limiter is None:
+        limiter = _LIMITERS[base_id] = RateLimiter(AIRTABLE_RATE_LIMIT)
+    return limiter
+
+def get_retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Get the delay before retrying, honoring Retry-After when present"""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+    return RETRY_BACKOFF * 2 ** attempt
+
+def get_session() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use"""
+    global SESSION
+    if SESSION is None or SESSION.is_closed:
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=MAX_RETRIES,
+            socket_options=SOCKET_OPTIONS,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+        )
+        SESSION = httpx.AsyncClient(transport=transport, timeout=30.0)
+    return SESSION
+
+async def send_request(method: str, url: str, **kwargs) -> httpx.Response:
+    """Send a request paced by the per-base rate limiter, retrying transient failures"""
+    session = get_session()
+    limiter = get_rate_limiter(url)
+    for attempt in range(MAX_RETRIES + 1):
+        if limiter:
+            await limiter.acquire()
+        response = await session.request(method, url, **kwargs)
+        if limiter:
+            if response.status_code == 429:
+                limiter.throttle()
+            elif response.status_code < 400:
+                limiter.recover()
+        retryable = response.status_code == 429 or (
+            response.status_code in RETRY_STATUSES and method.upper() in RETRY_5XX_METHODS
+        )
+        if not retryable or attempt == MAX_RETRIES:
+            return response
+        await asyncio.sleep(get_retry_delay(response, attempt))
 
 # Nango authentication
-def get_connection_credentials() -> Dict[str, Any]:
-    """Get credentials from Nango"""
-    connection_id = os.environ.get("NANGO_CONNECTION_ID")
-    integration_id = os.environ.get("NANGO_INTEGRATION_ID")
-    base_url = os.environ.get("NANGO_BASE_URL")
-    secret_key = os.environ.get("NANGO_SECRET_KEY")
-    
-    if not all([connection_id, integration_id, base_url, secret_key]):
-        missing_vars = [
-            var for var, val in [
-                ("NANGO_CONNECTION_ID", connection_id),
-                ("NANGO_INTEGRATION_ID", integration_id),
-                ("NANGO_BASE_URL", base_url),
-                ("NANGO_SECRET_KEY", secret_key)
-            ] if not val
-        ]
+NANGO_ENV_VARS = ("NANGO_CONNECTION_ID", "NANGO_INTEGRATION_ID", "NANGO_BASE_URL", "NANGO_SECRET_KEY")
+
+@dataclass(frozen=True)
+class NangoConfig:
+    """Nango connection request settings read from the environment"""
+    url: str
+    params: Dict[str, str]
+    headers: Dict[str, str]
+
+@lru_cache(maxsize=1)
+def get_nango_config() -> NangoConfig:
+    """Validate the Nango environment variables once and build the request settings"""
+    missing_vars = [var for var in NANGO_ENV_VARS if not os.environ.get(var)]
+    if missing_vars:
         raise ValueError(f"Missing required Nango environment variables: {', '.join(missing_vars)}")
     
-    url = f"{base_url}/connection/{connection_id}"
-    params = {
-        "provider_config_key": integration_id,
-        "refresh_token": "true",
-    }
-    headers = {"Authorization": f"Bearer {secret_key}"}
+    return NangoConfig(
+        url=f"{os.environ['NANGO_BASE_URL']}/connection/{os.environ['NANGO_CONNECTION_ID']}",
+        params={
+            "provider_config_key": os.environ["NANGO_INTEGRATION_ID"],
+            "refresh_token": "true",
+        },
+        headers={"Authorization": f"Bearer {os.environ['NANGO_SECRET_KEY']}"}
+    )
+
+async def get_connection_credentials(force_refresh: bool = False) -> Dict[str, Any]:
+    """Get credentials from Nango"""
+    config = get_nango_config()
+    params = {**config.params, "force_refresh": "true"} if force_refresh else config.params
     
     try:
-        response = requests.get(url, headers=headers, params=params)
+        response = await send_request("GET", config.url, headers=config.headers, params=params)
         response.raise_for_status()  # Raise exception for bad status codes
-        return response.json()
-    except requests.exceptions.RequestException as e:
+        return orjson.loads(response.content)
+    except httpx.HTTPError as e:
         raise ValueError(f"Failed to get Nango credentials: {str(e)}")
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Failed to parse Nango response: {str(e)}")
 
-def get_airtable_token() -> str:
-    """Get Airtable token from Nango"""
-    try:
-        credentials = get_connection_credentials()
-        # Extract access token from Nango response
-        if "credentials" in credentials and "access_token" in credentials["credentials"]:
-            return credentials["credentials"]["access_token"]
-        elif "access_token" in credentials:
-            return credentials["access_token"]
-        else:
-            raise ValueError("No access_token found in Nango credentials response")
-    except Exception as e:
-        raise ValueError(f"Failed to get authentication token from Nango: {str(e)}")
+def _token_ttl(credentials: Dict[str, Any]) -> float:
+    """Get seconds until the token expires, falling back to a conservative default"""
+    # expires_at is the real expiry; expires_in is only the lifetime at issue time
+    expires_at = credentials.get("expires_at")
+    if expires_at:
+        try:
+            expiry = datetime.fromisoformat(str(expires_at).replace("Z", "+00:00"))
+            if expiry.tzinfo is None:
+                expiry = expiry.replace(tzinfo=timezone.utc)
+            return (expiry - datetime.now(timezone.utc)).total_seconds()
+        except ValueError:
+            pass
+    
+    expires_in = credentials.get("expires_in") or (credentials.get("raw") or {}).get("expires_in")
+    if expires_in:
+        try:
+            return float(expires_in)
+        except (TypeError, ValueError):
+            pass
+    
+    return TOKEN_DEFAULT_TTL
+
+async def get_airtable_token() -> str:
+    """Get Airtable token from Nango, reusing the cached token until it nears expiry"""
+    async with _lock:
+        if _TOKEN_CACHE["token"] and time.monotonic() < _TOKEN_CACHE["expires_at"] - TOKEN_REFRESH_MARGIN:
+            return _TOKEN_CACHE["token"]
+        
+        try:
+            credentials = await get_connection_credentials(force_refresh=_TOKEN_CACHE["force_refresh"])
+            # Extract access token from Nango response
+            if "credentials" in credentials and "access_token" in credentials["credentials"]:
+                token_info = credentials["credentials"]
+            elif "access_token" in credentials:
+                token_info = credentials
+            else:
+                raise ValueError("No access_token found in Nango credentials response")
+            ttl = _token_ttl(token_info)
+        except Exception as e:
+            raise ValueError(f"Failed to get authentication token from Nango: {str(e)}")
+        
+        _TOKEN_CACHE["token"] = token_info["access_token"]
+        _TOKEN_CACHE["expires_at"] = time.monotonic() + ttl
+        _TOKEN_CACHE["force_refresh"] = False
+        _TOKEN_CACHE["headers"] = {
+            "Authorization": f"Bearer {_TOKEN_CACHE['token']}",
+            "Content-Type": "application/json"
+        }
+        return _TOKEN_CACHE["token"]
+
+def clear_token_cache(token: Optional[str] = None) -> None:
+    """Forget a rejected token so the next request makes Nango issue a fresh one"""
+    if token is None or _TOKEN_CACHE["token"] == token:
+        _TOKEN_CACHE.update({"token": None, "expires_at": 0.0, "headers": {}, "force_refresh": True})
 
 # Common headers for all requests
-def get_headers() -> Dict[str, str]:
-    """Get common headers for Airtable API requests"""
-    token = get_airtable_token()
-    
-    return {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json"
-    }
+async def get_headers() -> Dict[str, str]:
+    """Get common headers for Airtable API requests (shared dict, do not mutate)"""
+    await get_airtable_token()
+    return _TOKEN_CACHE["headers"]
 
 # Error handling wrapper
-def handle_api_request(method: str, url: str, **kwargs) -> Dict[str, Any]:
-    """Handle API requests with proper error handling"""
+async def send_api_request(method: str, url: str, allow_not_modified: bool = False, **kwargs) -> httpx.Response:
+    """Send an authenticated API request, raising ValueError on failure"""
     try:
-        headers = get_headers()
-        if 'headers' in kwargs:
-            headers.update(kwargs.pop('headers'))
-        
-        response = requests.request(method, url, headers=headers, **kwargs)
-        response.raise_for_status()
-        
-        # Handle empty responses
-        if not response.content:
-            return {"success": True}
+        extra_headers = kwargs.pop('headers', {})
+        if 'json' in kwargs:
+            kwargs['content'] = orjson.dumps(kwargs.pop('json'))
         
+        headers = await get_headers()
+        token = _TOKEN_CACHE["token"]
+        response = await send_request(method, url, headers={**headers, **extra_headers}, **kwargs)
+        if response.status_code == 401:
+            # The token was revoked or rotated early; fetch a fresh one and retry once
+            clear_token_cache(token)
+            response = await send_request(method, url, headers={**await get_headers(), **extra_headers}, **kwargs)
+        if not (allow_not_modified and response.status_code == 304):
+            response.raise_for_status()
+        return response
+    
+    except httpx.HTTPStatusError as e:
+        error_detail = f"HTTP {e.response.status_code}: {e.response.reason_phrase}"
         try:
-            return response.json()
-        except json.JSONDecodeError:
-            return {"raw_response": response.text}
-    
-    except requests.exceptions.HTTPError as e:
-        error_detail = f"HTTP {e.response.status_code}: {e.response.reason}"
-        try:
-            error_body = e.response.json()
+            error_body = orjson.loads(e.response.content)
             error_detail += f" - {error_body.get('error', {}).get('message', str(error_body))}"
         except:
             error_detail += f" - {e.response.text}"
         raise ValueError(error_detail)
     
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         raise ValueError(f"Request failed: {str(e)}")
     
     except Exception as e:
         raise ValueError(f"Unexpected error: {str(e)}")
 
+def parse_api_response(response: httpx.Response) -> Dict[str, Any]:
+    """Decode an API response body"""
+    # Handle empty responses
+    if not response.content:
+        return {"success": True}
+    
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        return {"raw_response": response.text}
+
+async def handle_api_request(method: str, url: str, **kwargs) -> Dict[str, Any]:
+    """Handle API requests with proper error handling"""
+    response = await send_api_request(method, url, **kwargs)
+    return parse_api_response(response)
+
+# Metadata cache for rarely changing schema/view/base listings
+async def handle_cached_request(url: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Handle a metadata GET request, serving from cache and revalidating with ETags"""
+    key = str(httpx.URL(url, params=params))
+    cached = _SCHEMA_CACHE.get(key)
+    if cached and time.monotonic() < cached[0]:
+        # Parse the cached body per call so callers never share a mutable dict
+        return parse_api_response(cached[2])
+    
+    headers = {"If-None-Match": cached[1]} if cached and cached[1] else {}
+    response = await send_api_request("GET", url, allow_not_modified=bool(headers), params=params, headers=headers)
+    if response.status_code == 304:
+        etag, response = response.headers.get("ETag", cached[1]), cached[2]
+    else:
+        etag = response.headers.get("ETag")
+    
+    _SCHEMA_CACHE[key] = (time.monotonic() + SCHEMA_CACHE_TTL, etag, response)
+    return parse_api_response(response)
+
+def invalidate_schema_cache(base_id: Optional[str] = None) -> None:
+    """Drop cached metadata for a base, or all cached metadata when no base is given"""
+    if base_id is None:
+        _SCHEMA_CACHE.clear()
+        return
+    prefix = f"{AIRTABLE_API_BASE}/meta/bases/{base_id}/"
+    for key in [key for key in _SCHEMA_CACHE if key.startswith(prefix)]:
+        del _SCHEMA_CACHE[key]
+
+# Batch helpers for Airtable's per-request record limit
+def chunk_list(items: List[Any], size: int = AIRTABLE_BATCH_SIZE) -> List[List[Any]]:
+    """Split a list into consecutive chunks of at most `size` items"""
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def merge_batch_responses(responses: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge chunked batch responses by concatenating their list fields"""
+    merged: Dict[str, Any] = {}
+    for response in responses:
+        for key, value in response.items():
+            if isinstance(value, list):
+                merged.setdefault(key, []).extend(value)
+            else:
+                merged.setdefault(key, value)
+    return merged
+
+async def guarded_request(method: str, url: str, **kwargs) -> Dict[str, Any]:
+    """Handle an API request under the shared concurrency limit"""
+    async with _HOST_SEM:
+        return await handle_api_request(method, url, **kwargs)
+
+async def handle_batch_requests(
+    method: str,
+    url: str,
+    chunks: List[List[Any]],
+    batches: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Send one request per chunk concurrently and merge the responses in order
+
+    Chunks that fail do not hide the ones Airtable already applied: the saved
+    chunks are merged and each failed chunk is reported under "errors".
+    """
+    results = await asyncio.gather(
+        *(guarded_request(method, url, **kwargs) for kwargs in batches),
+        return_exceptions=True
+    )
+    
+    responses, errors, saved_indices = [], [], []
+    start = 0
+    for chunk, result in zip(chunks, results):
+        indices = list(range(start, start + len(chunk)))
+        start += len(chunk)
+        if isinstance(result, Exception):
+            error = {"recordIndices": indices, "error": str(result)}
+            record_ids = [item if isinstance(item, str) else item.get("id") for item in chunk]
+            if any(record_ids):
+                error["recordIds"] = [record_id for record_id in record_ids if record_id]
+            errors.append(error)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            responses.append(result)
+            saved_indices.extend(indices)
+    
+    if not responses:
+        raise ValueError("; ".join(
+            f"Records {error['recordIndices'][0]}-{error['recordIndices'][-1]} failed: {error['error']}"
+            for error in errors
+        ))
+    
+    merged = merge_batch_responses(responses)
+    if errors:
+        merged["savedRecordIndices"] = saved_indices
+        merged["errors"] = errors
+    return merged
+
 # Base Models for structured output
-class BaseResponse(BaseModel):
+class AirtableModel(BaseModel):
+    """Base for Airtable response models, ignoring keys the API adds over time"""
+    model_config = ConfigDict(extra='ignore', frozen=True)
+
+class BaseResponse(AirtableModel):
     """Base response model"""
     success: bool = True
     message: Optional[str] = None
 
-class Record(BaseModel):
+class Record(AirtableModel):
     """Airtable record structure"""
     id: str
     createdTime: str
     fields: Dict[str, Any]
     commentCount: Optional[int] = None
 
-class Field(BaseModel):
+class AirtableField(AirtableModel):
     """Airtable field structure"""
     id: str
     name: str
@@ -135,21 +419,21 @@ class Field(BaseModel):
     description: Optional[str] = None
     options: Optional[Dict[str, Any]] = None
 
-class Table(BaseModel):
+class Table(AirtableModel):
     """Airtable table structure"""
     id: str
     name: str
     description: Optional[str] = None
     primaryFieldId: str
-    fields: List[Field]
+    fields: List[AirtableField]
 
-class Base(BaseModel):
+class Base(AirtableModel):
     """Airtable base structure"""
     id: str
     name: str
     permissionLevel: str
 
-class View(BaseModel):
+class View(AirtableModel):
     """Airtable view structure"""
     id: str
     name: str
@@ -157,7 +441,7 @@ class View(BaseModel):
     personalForUserId: Optional[str] = None
     visibleFieldIds: Optional[List[str]] = None
 
-class Comment(BaseModel):
+class Comment(AirtableModel):
     """Airtable comment structure"""
     id: str
     text: str
@@ -165,13 +449,13 @@ class Comment(BaseModel):
     lastUpdatedTime: Optional[str] = None
     author: Dict[str, Any]
 
-class User(BaseModel):
+class User(AirtableModel):
     """Airtable user structure"""
     id: str
     email: Optional[str] = None
     name: Optional[str] = None
 
-class Webhook(BaseModel):
+class Webhook(AirtableModel):
     """Airtable webhook structure"""
     id: str
     notificationUrl: Optional[str] = None
@@ -180,7 +464,7 @@ class Webhook(BaseModel):
     cursorForNextPayload: int
     lastSuccessfulNotificationTime: Optional[str] = None
 
-class Enterprise(BaseModel):
+class Enterprise(AirtableModel):
     """Airtable enterprise structure"""
     id: str
     createdTime: str
@@ -190,7 +474,7 @@ class Enterprise(BaseModel):
     workspaceIds: List[str]
 
 @mcp.tool()
-def list_records(
+async def list_records(
     base_id: str,
     table_id_or_name: str,
     fields: Optional[List[str]] = None,
@@ -201,16 +485,28 @@ def list_records(
     view: Optional[str] = None,
     cell_format: Optional[str] = None,
     time_zone: Optional[str] = None,
-    user_locale: Optional[str] = None
+    user_locale: Optional[str] = None,
+    offset: Optional[str] = None,
+    auto_paginate: bool = False,
+    max_pages: Optional[int] = None
 ) -> Dict[str, Any]:
-    """List records in a table"""
+    """List records in a table, optionally following offsets across pages
+
+    Returns one page (up to 100 records) unless auto_paginate is set. Pass a
+    returned "offset" back as offset to get the next page. With auto_paginate,
+    pages are fetched and combined until the table is exhausted or max_pages
+    (default 10, must be at least 1) pages have been read; if records remain,
+    the result includes an "offset" to resume from.
+    """
+    
+    if max_pages is not None and max_pages < 1:
+        raise ValueError("max_pages must be at least 1")
     
     url = f"{AIRTABLE_API_BASE}/{base_id}/{table_id_or_name}"
     params = {}
     
     if fields:
-        for field in fields:
-            params[f"fields[]"] = field
+        params["fields[]"] = list(fields)
     if filter_by_formula:
         params["filterByFormula"] = filter_by_formula
     if max_records:
@@ -225,15 +521,37 @@ def list_records(
         params["timeZone"] = time_zone
     if user_locale:
         params["userLocale"] = user_locale
+    if offset:
+        params["offset"] = offset
     if sort:
         for i, sort_obj in enumerate(sort):
             for key, value in sort_obj.items():
                 params[f"sort[{i}][{key}]"] = value
     
-    return handle_api_request("GET", url, params=params)
+    if not auto_paginate:
+        return await handle_api_request("GET", url, params=params)
+    
+    if max_pages is None:
+        max_pages = AUTO_PAGINATE_MAX_PAGES
+    
+    records = []
+    pages = 0
+    while True:
+        response = await guarded_request("GET", url, params=params)
+        records.extend(response.get("records", []))
+        pages += 1
+        offset = response.get("offset")
+        if not offset or pages >= max_pages:
+            break
+        params = {**params, "offset": offset}
+    
+    result = {"records": records}
+    if offset:
+        result["offset"] = offset
+    return result
 
 @mcp.tool()
-def get_record(
+async def get_record(
     base_id: str,
     table_id_or_name: str,
     record_id: str,
@@ -250,10 +568,10 @@ def get_record(
     if return_fields_by_field_id is not None:
         params["returnFieldsByFieldId"] = return_fields_by_field_id
     
-    return handle_api_request("GET", url, params=params)
+    return await handle_api_request("GET", url, params=params)
 
 @mcp.tool()
-def create_records(
+async def create_records(
     base_id: str,
     table_id_or_name: str,
     records: Optional[List[Dict[str, Any]]] = None,
@@ -276,10 +594,20 @@ def create_records(
     if return_fields_by_field_id is not None:
         data["returnFieldsByFieldId"] = return_fields_by_field_id
     
-    return handle_api_request("POST", url, json=data)
+    if records and len(records) > AIRTABLE_BATCH_SIZE:
+        chunks = chunk_list(records)
+        batches = [{"json": {**data, "records": chunk}} for chunk in chunks]
+        result = await handle_batch_requests("POST", url, chunks, batches)
+    else:
+        result = await handle_api_request("POST", url, json=data)
+    
+    # typecast can add select choices, changing the cached field schema
+    if typecast:
+        invalidate_schema_cache(base_id)
+    return result
 
 @mcp.tool()
-def update_record(
+async def update_record(
     base_id: str,
     table_id_or_name: str,
     record_id: str,
@@ -297,10 +625,15 @@ def update_record(
     if return_fields_by_field_id is not None:
         data["returnFieldsByFieldId"] = return_fields_by_field_id
     
-    return handle_api_request("PATCH", url, json=data)
+    result = await handle_api_request("PATCH", url, json=data)
+    
+    # typecast can add select choices, changing the cached field schema
+    if typecast:
+        invalidate_schema_cache(base_id)
+    return result
 
 @mcp.tool()
-def update_multiple_records(
+async def update_multiple_records(
     base_id: str,
     table_id_or_name: str,
     records: List[Dict[str, Any]],
@@ -323,10 +656,20 @@ def update_multiple_records(
     if fields_to_merge_on:
         data["fieldsToMergeOn"] = fields_to_merge_on
     
-    return handle_api_request("PATCH", url, json=data)
+    if len(records) > AIRTABLE_BATCH_SIZE:
+        chunks = chunk_list(records)
+        batches = [{"json": {**data, "records": chunk}} for chunk in chunks]
+        result = await handle_batch_requests("PATCH", url, chunks, batches)
+    else:
+        result = await handle_api_request("PATCH", url, json=data)
+    
+    # typecast can add select choices, changing the cached field schema
+    if typecast:
+        invalidate_schema_cache(base_id)
+    return result
 
 @mcp.tool()
-def delete_record(
+async def delete_record(
     base_id: str,
     table_id_or_name: str,
     record_id: str
@@ -334,10 +677,10 @@ def delete_record(
     """Delete a single record"""
     
     url = f"{AIRTABLE_API_BASE}/{base_id}/{table_id_or_name}/{record_id}"
-    return handle_api_request("DELETE", url)
+    return await handle_api_request("DELETE", url)
 
 @mcp.tool()
-def delete_multiple_records(
+async def delete_multiple_records(
     base_id: str,
     table_id_or_name: str,
     record_ids: List[str]
@@ -345,12 +688,17 @@ def delete_multiple_records(
     """Delete multiple records"""
     
     url = f"{AIRTABLE_API_BASE}/{base_id}/{table_id_or_name}"
+    if len(record_ids) > AIRTABLE_BATCH_SIZE:
+        chunks = chunk_list(record_ids)
+        batches = [{"params": {"records[]": chunk}} for chunk in chunks]
+        return await handle_batch_requests("DELETE", url, chunks, batches)
+    
     params = {"records[]": record_ids}
-    return handle_api_request("DELETE", url, params=params)
+    return await handle_api_request("DELETE", url, params=params)
 
 # Bases API Tools
 @mcp.tool()
-def list_bases(offset: Optional[str] = None) -> Dict[str, Any]:
+async def list_bases(offset: Optional[str] = None) -> Dict[str, Any]:
     """List all accessible bases"""
     
     url = f"{AIRTABLE_API_BASE}/meta/bases"
@@ -358,10 +706,10 @@ def list_bases(offset: Optional[str] = None) -> Dict[str, Any]:
     if offset:
         params["offset"] = offset
     
-    return handle_api_request("GET", url, params=params)
+    return await handle_cached_request(url, params=params)
 
 @mcp.tool()
-def get_base_schema(base_id: str, include: Optional[List[str]] = None) -> Dict[str, Any]:
+async def get_base_schema(base_id: str, include: Optional[List[str]] = None) -> Dict[str, Any]:
     """Get base schema including tables and fields"""
     
     url = f"{AIRTABLE_API_BASE}/meta/bases/{base_id}/tables"
@@ -369,10 +717,10 @@ def get_base_schema(base_id: str, include: Optional[List[str]] = None) -> Dict[s
     if include:
         params["include"] = include
     
-    return handle_api_request("GET", url, params=params)
+    return await handle_cached_request(url, params=params)
 
 @mcp.tool()
-def create_base(
+async def create_base(
     name: str,
     workspace_id: str,
     tables: List[Dict[str, Any]]
@@ -386,10 +734,12 @@ def create_base(
         "tables": tables
     }
     
-    return handle_api_request("POST", url, json=data)
+    response = await handle_api_request("POST", url, json=data)
+    invalidate_schema_cache()
+    return response
 
 @mcp.tool()
-def get_base_collaborators(
+async def get_base_collaborators(
     base_id: str,
     include: Optional[List[str]] = None
 ) -> Dict[str, Any]:
@@ -400,18 +750,20 @@ def get_base_collaborators(
     if include:
         params["include"] = include
     
-    return handle_api_request("GET", url, params=params)
+    return await handle_api_request("GET", url, params=params)
 
 @mcp.tool()
-def delete_base(base_id: str) -> Dict[str, Any]:
+async def delete_base(base_id: str) -> Dict[str, Any]:
     """Delete a base"""
     
     url = f"{AIRTABLE_API_BASE}/meta/bases/{base_id}"
-    return handle_api_request("DELETE", url)
+    response = await handle_api_request("DELETE", url)
+    invalidate_schema_cache()
+    return response
 
 # Tables API Tools
 @mcp.tool()
-def create_table(
+async def create_table(
     base_id: str,
     name: str,
     fields: List[Dict[str, Any]],
@@ -427,10 +779,12 @@ def create_table(
     if description:
         data["description"] = description
     
-    return handle_api_request("POST", url, json=data)
+    response = await handle_api_request("POST", url, json=data)
+    invalidate_schema_cache(base_id)
+    return response
 
 @mcp.tool()
-def update_table(
+async def update_table(
     base_id: str,
     table_id_or_name: str,
     name: Optional[str] = None,
@@ -446,11 +800,13 @@ def update_table(
     if description is not None:
         data["description"] = description
     
-    return handle_api_request("PATCH", url, json=data)
+    response = await handle_api_request("PATCH", url, json=data)
+    invalidate_schema_cache(base_id)
+    return response
 
 # Fields API Tools
 @mcp.tool()
-def create_field(
+async def create_field(
     base_id: str,
     table_id: str,
     name: str,
@@ -471,10 +827,12 @@ def create_field(
     if options is not None:
         data["options"] = options
     
-    return handle_api_request("POST", url, json=data)
+    response = await handle_api_request("POST", url, json=data)
+    invalidate_schema_cache(base_id)
+    return response
 
 @mcp.tool()
-def update_field(
+async def update_field(
     base_id: str,
     table_id: str,
     field_id: str,
@@ -491,11 +849,13 @@ def update_field(
     if description is not None:
         data["description"] = description
     
-    return handle_api_request("PATCH", url, json=data)
+    response = await handle_api_request("PATCH", url, json=data)
+    invalidate_schema_cache(base_id)
+    return response
 
 # Views API Tools
 @mcp.tool()
-def list_views(base_id: str, include: Optional[List[str]] = None) -> Dict[str, Any]:
+async def list_views(base_id: str, include: Optional[List[str]] = None) -> Dict[str, Any]:
     """List all views in a base"""
     
     url = f"{AIRTABLE_API_BASE}/meta/bases/{base_id}/views"
@@ -503,10 +863,10 @@ def list_views(base_id: str, include: Optional[List[str]] = None) -> Dict[str, A
     if include:
         params["include"] = include
     
-    return handle_api_request("GET", url, params=params)
+    return await handle_cached_request(url, params=params)
 
 @mcp.tool()
-def get_view_metadata(
+async def get_view_metadata(
     base_id: str,
     view_id: str,
     include: Optional[List[str]] = None
@@ -518,18 +878,20 @@ def get_view_metadata(
     if include:
         params["include"] = include
     
-    return handle_api_request("GET", url, params=params)
+    return await handle_cached_request(url, params=params)
 
 @mcp.tool()
-def delete_view(base_id: str, view_id: str) -> Dict[str, Any]:
+async def delete_view(base_id: str, view_id: str) -> Dict[str, Any]:
     """Delete a view"""
     
     url = f"{AIRTABLE_API_BASE}/meta/bases/{base_id}/views/{view_id}"
-    return handle_api_request("DELETE", url)
+    response = await handle_api_request("DELETE", url)
+    invalidate_schema_cache(base_id)
+    return response
 
 # Comments API Tools
 @mcp.tool()
-def list_comments(
+async def list_comments(
     base_id: str,
     table_id_or_name: str,
     record_id: str,
@@ -546,10 +908,10 @@ def list_comments(
     if offset:
         params["offset"] = offset
     
-    return handle_api_request("GET", url, params=params)
+    return await handle_api_request("GET", url, params=params)
 
 @mcp.tool()
-def create_comment(
+async def create_comment(
     base_id: str,
     table_id_or_name: str,
     record_id: str,
@@ -564,10 +926,10 @@ def create_comment(
     if parent_comment_id:
         data["parentCommentId"] = parent_comment_id
     
-    return handle_api_request("POST", url, json=data)
+    return await handle_api_request("POST", url, json=data)
 
 @mcp.tool()
-def update_comment(
+async def update_comment(
     base_id: str,
     table_id_or_name: str,
     record_id: str,
@@ -579,10 +941,10 @@ def update_comment(
     url = f"{AIRTABLE_API_BASE}/{base_id}/{table_id_or_name}/{record_id}/comments/{comment_id}"
     data = {"text": text}
     
-    return handle_api_request("PATCH", url, json=data)
+    return await handle_api_request("PATCH", url, json=data)
 
 @mcp.tool()
-def delete_comment(
+async def delete_comment(
     base_id: str,
     table_id_or_name: str,
     record_id: str,
@@ -591,18 +953,18 @@ def delete_comment(
     """Delete a comment"""
     
     url = f"{AIRTABLE_API_BASE}/{base_id}/{table_id_or_name}/{record_id}/comments/{comment_id}"
-    return handle_api_request("DELETE", url)
+    return await handle_api_request("DELETE", url)
 
 # Webhooks API Tools
 @mcp.tool()
-def list_webhooks(base_id: str) -> Dict[str, Any]:
+async def list_webhooks(base_id: str) -> Dict[str, Any]:
     """List all webhooks for a base"""
     
     url = f"{AIRTABLE_API_BASE}/bases/{base_id}/webhooks"
-    return handle_api_request("GET", url)
+    return await handle_api_request("GET", url)
 
 @mcp.tool()
-def create_webhook(
+async def create_webhook(
     base_id: str,
     notification_url: Optional[str] = None,
     specification: Optional[Dict[str, Any]] = None
@@ -617,17 +979,17 @@ def create_webhook(
     if specification:
         data["specification"] = specification
     
-    return handle_api_request("POST", url, json=data)
+    return await handle_api_request("POST", url, json=data)
 
 @mcp.tool()
-def delete_webhook(base_id: str, webhook_id: str) -> Dict[str, Any]:
+async def delete_webhook(base_id: str, webhook_id: str) -> Dict[str, Any]:
     """Delete a webhook"""
     
     url = f"{AIRTABLE_API_BASE}/bases/{base_id}/webhooks/{webhook_id}"
-    return handle_api_request("DELETE", url)
+    return await handle_api_request("DELETE", url)
 
 @mcp.tool()
-def list_webhook_payloads(
+async def list_webhook_payloads(
     base_id: str,
     webhook_id: str,
     cursor: Optional[int] = None,
@@ -643,10 +1005,10 @@ def list_webhook_payloads(
     if limit is not None:
         params["limit"] = limit
     
-    return handle_api_request("GET", url, params=params)
+    return await handle_api_request("GET", url, params=params)
 
 @mcp.tool()
-def enable_disable_webhook_notifications(
+async def enable_disable_webhook_notifications(
     base_id: str,
     webhook_id: str,
     enable: bool
@@ -656,18 +1018,18 @@ def enable_disable_webhook_notifications(
     url = f"{AIRTABLE_API_BASE}/bases/{base_id}/webhooks/{webhook_id}/enableNotifications"
     data = {"enable": enable}
     
-    return handle_api_request("POST", url, json=data)
+    return await handle_api_request("POST", url, json=data)
 
 @mcp.tool()
-def refresh_webhook(base_id: str, webhook_id: str) -> Dict[str, Any]:
+async def refresh_webhook(base_id: str, webhook_id: str) -> Dict[str, Any]:
     """Refresh a webhook to extend its life"""
     
     url = f"{AIRTABLE_API_BASE}/bases/{base_id}/webhooks/{webhook_id}/refresh"
-    return handle_api_request("POST", url)
+    return await handle_api_request("POST", url)
 
 # Collaborators API Tools
 @mcp.tool()
-def add_base_collaborator(
+async def add_base_collaborator(
     base_id: str,
     user_id: Optional[str] = None,
     group_id: Optional[str] = None,
@@ -690,10 +1052,10 @@ def add_base_collaborator(
         })
     
     data = {"collaborators": collaborators}
-    return handle_api_request("POST", url, json=data)
+    return await handle_api_request("POST", url, json=data)
 
 @mcp.tool()
-def update_collaborator_base_permission(
+async def update_collaborator_base_permission(
     base_id: str,
     user_or_group_id: str,
     permission_level: str
@@ -703,17 +1065,17 @@ def update_collaborator_base_permission(
     url = f"{AIRTABLE_API_BASE}/meta/bases/{base_id}/collaborators/{user_or_group_id}"
     data = {"permissionLevel": permission_level}
     
-    return handle_api_request("PATCH", url, json=data)
+    return await handle_api_request("PATCH", url, json=data)
 
 @mcp.tool()
-def delete_base_collaborator(base_id: str, user_or_group_id: str) -> Dict[str, Any]:
+async def delete_base_collaborator(base_id: str, user_or_group_id: str) -> Dict[str, Any]:
     """Remove a collaborator from a base"""
     
     url = f"{AIRTABLE_API_BASE}/meta/bases/{base_id}/collaborators/{user_or_group_id}"
-    return handle_api_request("DELETE", url)
+    return await handle_api_request("DELETE", url)
 
 @mcp.tool()
-def get_workspace_collaborators(
+async def get_workspace_collaborators(
     workspace_id: str,
     include: Optional[List[str]] = None
 ) -> Dict[str, Any]:
@@ -724,19 +1086,19 @@ def get_workspace_collaborators(
     if include:
         params["include"] = include
     
-    return handle_api_request("GET", url, params=params)
+    return await handle_api_request("GET", url, params=params)
 
 # User Info API Tools
 @mcp.tool()
-def get_user_info() -> Dict[str, Any]:
+async def get_user_info() -> Dict[str, Any]:
     """Get current user information"""
     
     url = f"{AIRTABLE_API_BASE}/meta/whoami"
-    return handle_api_request("GET", url)
+    return await handle_api_request("GET", url)
 
 # Enterprise API Tools
 @mcp.tool()
-def get_enterprise(
+async def get_enterprise(
     enterprise_account_id: str,
     include: Optional[List[str]] = None
 ) -> Dict[str, Any]:
@@ -747,10 +1109,10 @@ def get_enterprise(
     if include:
         params["include"] = include
     
-    return handle_api_request("GET", url, params=params)
+    return await handle_api_request("GET", url, params=params)
 
 @mcp.tool()
-def get_user_by_id(
+async def get_user_by_id(
     enterprise_account_id: str,
     user_id: str,
     include: Optional[List[str]] = None
@@ -762,10 +1124,10 @@ def get_user_by_id(
     if include:
         params["include"] = include
     
-    return handle_api_request("GET", url, params=params)
+    return await handle_api_request("GET", url, params=params)
 
 @mcp.tool()
-def get_users_by_id_or_email(
+async def get_users_by_id_or_email(
     enterprise_account_id: str,
     user_ids: Optional[List[str]] = None,
     emails: Optional[List[str]] = None,
@@ -777,18 +1139,16 @@ def get_users_by_id_or_email(
     params = {}
     
     if user_ids:
-        for user_id in user_ids:
-            params["id[]"] = user_id
+        params["id[]"] = user_ids
     if emails:
-        for email in emails:
-            params["email[]"] = email
+        params["email[]"] = emails
     if include:
         params["include"] = include
     
-    return handle_api_request("GET", url, params=params)
+    return await handle_api_request("GET", url, params=params)
 
 @mcp.tool()
-def remove_user_from_enterprise(
+async def remove_user_from_enterprise(
     enterprise_account_id: str,
     user_id: str,
     replacement_owner_id: Optional[str] = None,
@@ -807,22 +1167,22 @@ def remove_user_from_enterprise(
     if is_dry_run is not None:
         data["isDryRun"] = is_dry_run
     
-    return handle_api_request("POST", url, json=data)
+    return await handle_api_request("POST", url, json=data)
 
 # Shares API Tools
 @mcp.tool()
-def list_shares(base_id: str) -> Dict[str, Any]:
+async def list_shares(base_id: str) -> Dict[str, Any]:
     """List base shares"""
     
     url = f"{AIRTABLE_API_BASE}/meta/bases/{base_id}/shares"
-    return handle_api_request("GET", url)
+    return await handle_api_request("GET", url)
 
 @mcp.tool()
-def delete_share(base_id: str, share_id: str) -> Dict[str, Any]:
+async def delete_share(base_id: str, share_id: str) -> Dict[str, Any]:
     """Delete a share"""
     
     url = f"{AIRTABLE_API_BASE}/meta/bases/{base_id}/shares/{share_id}"
-    return handle_api_request("DELETE", url)
+    return await handle_api_request("DELETE", url)
 
 def main():
     """Main function to run the MCP server"""
@@ -0,0 +1,33 @@
+"""Shared fixtures for the Airtable MCP server tests"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+import main
+
+
+@pytest.fixture
+def airtable(monkeypatch):
+    """Route the shared client through a mock transport with a pre-seeded token
+
+    Returns an installer taking the transport handler; isolates every module-level
+    cache, lock and limiter so tests cannot leak state into each other.
+    """
+    monkeypatch.setattr(main, "_TOKEN_CACHE", {
+        "token": "test-token",
+        "expires_at": time.monotonic() + 3600,
+        "headers": {"Authorization": "Bearer test-token", "Content-Type": "application/json"},
+        "force_refresh": False,
+    })
+    monkeypatch.setattr(main, "_lock", asyncio.Lock())
+    monkeypatch.setattr(main, "_HOST_SEM", asyncio.Semaphore(8))
+    monkeypatch.setattr(main, "_LIMITERS", {})
+    monkeypatch.setattr(main, "_SCHEMA_CACHE", {})
+
+    def install(handler):
+        monkeypatch.setattr(main, "SESSION", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    return install
@@ -0,0 +1,71 @@
+"""Tests for chunked batch writes"""
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+import main
+
+BASE_URL = f"{main.AIRTABLE_API_BASE}/appTest/tblTest"
+
+
+def make_records(count):
+    return [{"fields": {"Name": f"r{i}"}} for i in range(count)]
+
+
+def test_create_records_splits_into_chunks_and_merges_in_order(airtable):
+    sizes = []
+
+    def handler(request):
+        records = orjson.loads(request.content)["records"]
+        sizes.append(len(records))
+        return httpx.Response(200, json={"records": [{"id": f"rec{r['fields']['Name']}"} for r in records]})
+
+    airtable(handler)
+    result = asyncio.run(main.create_records("appTest", "tblTest", records=make_records(25)))
+
+    assert sorted(sizes) == [5, 10, 10]
+    assert [r["id"] for r in result["records"]] == [f"recr{i}" for i in range(25)]
+    assert "errors" not in result
+
+
+def test_create_records_reports_failed_chunk_and_keeps_saved_ones(airtable):
+    def handler(request):
+        records = orjson.loads(request.content)["records"]
+        if records[0]["fields"]["Name"] == "r10":
+            return httpx.Response(422, json={"error": {"message": "Invalid field"}})
+        return httpx.Response(200, json={"records": [{"id": f"rec{r['fields']['Name']}"} for r in records]})
+
+    airtable(handler)
+    result = asyncio.run(main.create_records("appTest", "tblTest", records=make_records(25)))
+
+    assert [r["id"] for r in result["records"]] == [f"recr{i}" for i in [*range(10), *range(20, 25)]]
+    assert result["savedRecordIndices"] == [*range(10), *range(20, 25)]
+    assert len(result["errors"]) == 1
+    assert result["errors"][0]["recordIndices"] == list(range(10, 20))
+    assert "Invalid field" in result["errors"][0]["error"]
+
+
+def test_delete_multiple_records_reports_failed_ids(airtable):
+    record_ids = [f"rec{i}" for i in range(12)]
+
+    def handler(request):
+        ids = request.url.params.get_list("records[]")
+        if "rec10" in ids:
+            return httpx.Response(404, json={"error": {"message": "Not found"}})
+        return httpx.Response(200, json={"records": [{"id": i, "deleted": True} for i in ids]})
+
+    airtable(handler)
+    result = asyncio.run(main.delete_multiple_records("appTest", "tblTest", record_ids))
+
+    assert [r["id"] for r in result["records"]] == record_ids[:10]
+    assert result["errors"][0]["recordIds"] == ["rec10", "rec11"]
+
+
+def test_batch_raises_when_every_chunk_fails(airtable):
+    airtable(lambda request: httpx.Response(422, json={"error": {"message": "Invalid field"}}))
+
+    with pytest.raises(ValueError, match=r"Records 0-9 failed: .*Invalid field"):
+        asyncio.run(main.create_records("appTest", "tblTest", records=make_records(15)))
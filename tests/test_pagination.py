@@ -0,0 +1,69 @@
+"""Tests for list_records auto-pagination"""
+
+import asyncio
+
+import httpx
+import pytest
+
+import main
+
+
+def paged_table(total_pages, calls):
+    """Handler serving `total_pages` one-record pages linked by offsets"""
+    def handler(request):
+        page = int(request.url.params.get("offset", "0"))
+        calls.append(page)
+        body = {"records": [{"id": f"rec{page}"}]}
+        if page + 1 < total_pages:
+            body["offset"] = str(page + 1)
+        return httpx.Response(200, json=body)
+    return handler
+
+
+def test_single_page_by_default(airtable):
+    calls = []
+    airtable(paged_table(3, calls))
+
+    result = asyncio.run(main.list_records("appTest", "tblTest"))
+
+    assert calls == [0]
+    assert result == {"records": [{"id": "rec0"}], "offset": "1"}
+
+
+def test_auto_paginate_follows_offsets_to_the_end(airtable):
+    calls = []
+    airtable(paged_table(3, calls))
+
+    result = asyncio.run(main.list_records("appTest", "tblTest", auto_paginate=True))
+
+    assert calls == [0, 1, 2]
+    assert result == {"records": [{"id": "rec0"}, {"id": "rec1"}, {"id": "rec2"}]}
+
+
+def test_auto_paginate_stops_at_max_pages_and_returns_offset(airtable):
+    calls = []
+    airtable(paged_table(5, calls))
+
+    result = asyncio.run(main.list_records("appTest", "tblTest", auto_paginate=True, max_pages=2))
+
+    assert calls == [0, 1]
+    assert result["offset"] == "2"
+
+
+def test_auto_paginate_has_default_page_cap(airtable, monkeypatch):
+    monkeypatch.setattr(main, "AUTO_PAGINATE_MAX_PAGES", 3)
+    calls = []
+    airtable(paged_table(50, calls))
+
+    result = asyncio.run(main.list_records("appTest", "tblTest", auto_paginate=True))
+
+    assert len(calls) == 3
+    assert result["offset"] == "3"
+
+
+@pytest.mark.parametrize("max_pages", [0, -1])
+def test_max_pages_below_one_is_rejected(airtable, max_pages):
+    airtable(lambda request: pytest.fail("no request expected"))
+
+    with pytest.raises(ValueError, match="max_pages"):
+        asyncio.run(main.list_records("appTest", "tblTest", auto_paginate=True, max_pages=max_pages))
@@ -0,0 +1,130 @@
+"""Tests for the per-base rate limiter and retry policy"""
+
+import asyncio
+
+import httpx
+import pytest
+
+import main
+
+
+class FakeClock:
+    """Deterministic stand-in for time.monotonic and asyncio.sleep"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(main.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(main.asyncio, "sleep", clock.sleep)
+    return clock
+
+
+def acquire(limiter, times):
+    async def run():
+        for _ in range(times):
+            await limiter.acquire()
+    asyncio.run(run())
+
+
+def test_bucket_allows_burst_then_paces(clock):
+    limiter = main.RateLimiter(5)
+
+    acquire(limiter, 5)
+    assert clock.sleeps == []
+
+    acquire(limiter, 1)
+    assert clock.sleeps == [pytest.approx(0.2)]
+
+
+def test_bucket_refills_over_time(clock):
+    limiter = main.RateLimiter(5)
+    acquire(limiter, 5)
+
+    clock.now += 1.0
+    acquire(limiter, 5)
+    assert clock.sleeps == []
+
+
+def test_throttle_halves_rate_with_floor_of_one(clock):
+    limiter = main.RateLimiter(5)
+
+    limiter.throttle()
+    assert limiter.rate == 2.5
+    limiter.throttle()
+    limiter.throttle()
+    assert limiter.rate == 1.0
+    limiter.throttle()
+    assert limiter.rate == 1.0
+
+
+def test_recover_grows_rate_back_to_max(clock):
+    limiter = main.RateLimiter(5)
+    limiter.throttle()
+
+    limiter.recover()
+    assert limiter.rate == 3.0
+    for _ in range(10):
+        limiter.recover()
+    assert limiter.rate == 5
+
+
+@pytest.mark.parametrize("headers, attempt, expected", [
+    ({"Retry-After": "2"}, 0, 2.0),
+    ({"Retry-After": "-1"}, 0, 0.0),
+    ({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}, 1, 1.0),
+    ({}, 0, 0.5),
+    ({}, 2, 2.0),
+])
+def test_retry_delay_prefers_retry_after_over_backoff(headers, attempt, expected):
+    response = httpx.Response(429, headers=headers)
+    assert main.get_retry_delay(response, attempt) == expected
+
+
+def test_rate_limiter_is_shared_per_base(monkeypatch):
+    monkeypatch.setattr(main, "_LIMITERS", {})
+    url = f"{main.AIRTABLE_API_BASE}/appOne/tblTest"
+    limiter = main.get_rate_limiter(url)
+
+    assert main.get_rate_limiter(f"{main.AIRTABLE_API_BASE}/meta/bases/appOne/tables") is limiter
+    assert main.get_rate_limiter(f"{main.AIRTABLE_API_BASE}/appTwo/tblTest") is not limiter
+    assert main.get_rate_limiter(f"{main.AIRTABLE_API_BASE}/meta/whoami") is None
+    assert main.get_rate_limiter("https://api.nango.dev/connection/appOne") is None
+
+
+def test_429_is_retried_after_retry_after_and_throttles(airtable, clock):
+    statuses = iter([429, 200])
+    airtable(lambda request: httpx.Response(next(statuses), headers={"Retry-After": "3"}, json={}))
+
+    url = f"{main.AIRTABLE_API_BASE}/appTest/tblTest"
+    response = asyncio.run(main.send_request("POST", url))
+
+    assert response.status_code == 200
+    assert 3.0 in clock.sleeps
+    assert main._LIMITERS["appTest"].rate == 3.0
+
+
+@pytest.mark.parametrize("method, expected_calls", [("POST", 1), ("PATCH", 1), ("GET", 2), ("DELETE", 2)])
+def test_5xx_is_only_retried_for_idempotent_methods(airtable, clock, method, expected_calls):
+    calls = []
+    statuses = iter([502, 200])
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(next(statuses))
+
+    airtable(handler)
+    asyncio.run(main.send_request(method, f"{main.AIRTABLE_API_BASE}/appTest/tblTest"))
+
+    assert len(calls) == expected_calls
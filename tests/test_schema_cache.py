@@ -0,0 +1,92 @@
+"""Tests for the metadata cache and its ETag revalidation"""
+
+import asyncio
+
+import httpx
+import pytest
+
+import main
+
+SCHEMA = {"tables": [{"id": "tblTest", "fields": [{"id": "fldStatus", "options": {"choices": ["a"]}}]}]}
+
+
+@pytest.fixture
+def schema_server(airtable):
+    """Serve SCHEMA with an ETag, answering matching If-None-Match with 304"""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.method != "GET":
+            return httpx.Response(200, json={"id": "recNew", "records": []})
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, headers={"ETag": '"v1"'}, json=SCHEMA)
+
+    airtable(handler)
+    return requests
+
+
+def expire_cache():
+    for key, (_, etag, response) in main._SCHEMA_CACHE.items():
+        main._SCHEMA_CACHE[key] = (0.0, etag, response)
+
+
+def test_schema_is_served_from_cache_within_ttl(schema_server):
+    first = asyncio.run(main.get_base_schema("appTest"))
+    second = asyncio.run(main.get_base_schema("appTest"))
+
+    assert first == second == SCHEMA
+    assert len(schema_server) == 1
+
+
+def test_cached_schema_is_copied_per_caller(schema_server):
+    first = asyncio.run(main.get_base_schema("appTest"))
+    first["tables"].clear()
+
+    assert asyncio.run(main.get_base_schema("appTest")) == SCHEMA
+
+
+def test_expired_entry_revalidates_and_reuses_body_on_304(schema_server):
+    asyncio.run(main.get_base_schema("appTest"))
+    expire_cache()
+
+    result = asyncio.run(main.get_base_schema("appTest"))
+
+    assert result == SCHEMA
+    assert len(schema_server) == 2
+    assert schema_server[1].headers["If-None-Match"] == '"v1"'
+    assert main._SCHEMA_CACHE[next(iter(main._SCHEMA_CACHE))][0] > main.time.monotonic()
+
+
+def test_304_without_a_cached_entry_is_an_error(airtable):
+    airtable(lambda request: httpx.Response(304))
+
+    with pytest.raises(ValueError, match="HTTP 304"):
+        asyncio.run(main.handle_api_request("GET", f"{main.AIRTABLE_API_BASE}/meta/whoami"))
+
+
+def test_invalidation_only_drops_entries_for_that_base(schema_server):
+    asyncio.run(main.get_base_schema("appOne"))
+    asyncio.run(main.list_views("appOne"))
+    asyncio.run(main.get_base_schema("appOneMore"))
+    asyncio.run(main.list_bases())
+
+    main.invalidate_schema_cache("appOne")
+
+    assert sorted(main._SCHEMA_CACHE) == [
+        f"{main.AIRTABLE_API_BASE}/meta/bases",
+        f"{main.AIRTABLE_API_BASE}/meta/bases/appOneMore/tables",
+    ]
+
+    main.invalidate_schema_cache()
+    assert main._SCHEMA_CACHE == {}
+
+
+@pytest.mark.parametrize("typecast, invalidated", [(True, True), (None, False)])
+def test_typecast_writes_invalidate_the_base_schema(schema_server, typecast, invalidated):
+    asyncio.run(main.get_base_schema("appTest"))
+
+    asyncio.run(main.create_records("appTest", "tblTest", fields={"Status": "b"}, typecast=typecast))
+
+    assert (main._SCHEMA_CACHE == {}) is invalidated